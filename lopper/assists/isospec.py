@@ -13,6 +13,7 @@ import types
 import os
 import getopt
 import re
+import functools
 from pathlib import Path
 from pathlib import PurePath
 from lopper import Lopper
@@ -31,10 +32,32 @@ import humanfriendly
 from lopper.log import _init, _warning, _info, _error, _debug
 import logging
 
+# the logger that _info() and _debug() find for this file. The per entry
+# messages check it before building their (potentially large) strings,
+# since they are discarded at the default log level.
+_logger = logging.getLogger( __name__ )
+
+# precompiled patterns, the compatible check is consulted for every
+# device tree node lopper tests against this assist, and the cpu number
+# for every cpu entry, so we don't want to go through the re cache
+_RE_ISOSPEC_COMPAT = re.compile( r"isospec,isospec-v1|module,isospec" )
+_RE_CPU_NUM = re.compile( r".*?(\d+)" )
+
+# isospec_domain() command line options, and the option each of the
+# short and long forms select
+_OPTS_SHORT = "mpvc:h"
+_OPTS_LONG = [ "help", "audit", "verbose", "permissive", "nomemory", "compare=" ]
+_OPTS_MAP = {
+    '-m': "nomemory", "--nomemory": "nomemory",
+    '-v': "verbose", "--verbose": "verbose",
+    '-c': "compare", "--compare": "compare",
+    '-p': "permissive", "--permissive": "permissive",
+    "--audit": "audit",
+    '-h': "help", "--help": "help",
+}
+
 def is_compat( node, compat_string_to_test ):
-    if re.search( "isospec,isospec-v1", compat_string_to_test):
-        return isospec_domain
-    if re.search( "module,isospec", compat_string_to_test):
+    if _RE_ISOSPEC_COMPAT.search( compat_string_to_test ):
         return isospec_domain
     return ""
 
@@ -51,6 +74,19 @@ def set_bit(value, bit):
 def clear_bit(value, bit):
     return value & ~(1<<bit)
 
+def prop_list( prop ):
+    """ returns the values of a property as a list
+
+        Indexing a json property (or taking its length) decodes the
+        entire json value on every call, so the list is decoded once
+        and returned for iteration. Other properties are indexed as
+        they always were.
+    """
+    if prop.pclass == "json" and prop.value:
+        return json.loads( prop.value )
+
+    return [ prop[i] for i in range(len(prop)) ]
+
 def debug_exit( message = None ):
     if message:
         _info( message )
@@ -60,12 +96,14 @@ def debug_exit( message = None ):
 class domain_yaml(object):
 
     # static / class viriable
+    #
+    # keys are prefixes of the spec cpu names
     iso_cpus_to_device_tree_map = {
-                                "APU*": {
+                                "APU": {
                                           "compatible": "arm,cortex-a72",
                                           "el": 3
                                         },
-                                "RPU*": {
+                                "RPU": {
                                           "compatible": "arm,cortex-r5",
                                           "el": None
                                         }
@@ -76,6 +114,18 @@ class domain_yaml(object):
         self.tree.phandle_resolution = False
         self.sdt = sdt
 
+        # subsystem and domain nodes, indexed by exact name. If a name
+        # is added more than once, the first node added wins.
+        self.nodes_by_name = {}
+
+        # system device tree nodes, indexed by address. Built on first
+        # use by addr_nodes()
+        self.__addr_index = None
+
+        # system device tree node searches, indexed by name/regex.
+        # Filled by sdt_nodes()
+        self.__sdt_nodes = {}
+
 
     def subsystem_add( self, subsystem_name="default-subsystem", subsystem_id=0 ):
         subsystems_node = LopperNode( abspath=f"/domains/{subsystem_name}", name=subsystem_name )
@@ -84,6 +134,7 @@ class domain_yaml(object):
         subsystems_node.phandle_resolution = False
 
         self.tree = self.tree + subsystems_node
+        self.nodes_by_name.setdefault( subsystem_name, subsystems_node )
 
         return subsystems_node
 
@@ -110,50 +161,79 @@ class domain_yaml(object):
             _debug( f"               adding domain '{domain_name}' parent: {parent_domain}" )
             parent_domain + domain_node
 
+        self.nodes_by_name.setdefault( domain_name, domain_node )
+
         return domain_node
 
+    def node( self, name ):
+        """ returns the subsystem or domain node for a name
+        """
+        try:
+            return self.nodes_by_name[name]
+        except KeyError:
+            return self.tree.nodes( name )[0]
+
+    def addr_nodes( self, address ):
+        """ returns the system device tree nodes at an address
+
+            The system device tree isn't modified while the spec is
+            processed, so the address index is only built once, rather
+            than on every device lookup.
+        """
+        if self.__addr_index is None:
+            self.__addr_index = self.sdt.tree.addr_index()
+
+        return self.__addr_index.get( address )
+
+    def sdt_nodes( self, name ):
+        """ returns the system device tree nodes that match a name/regex
+
+            Every memory entry searches the tree with the same few
+            patterns, so the matches are kept for the next lookup.
+        """
+        try:
+            return self.__sdt_nodes[name]
+        except KeyError:
+            nodes = self.sdt.tree.nodes( name )
+            self.__sdt_nodes[name] = nodes
+
+        return nodes
+
     def cpu_map( self, cpu_name ):
-        cpu_map = {}
         for n,dn in domain_yaml.iso_cpus_to_device_tree_map.items():
-            if re.search( n, cpu_name ):
-                cpu_map = dn
+            if cpu_name.startswith( n ):
+                return dn
 
-        return cpu_map
+        return {}
 
     def device_flags_map( self, device_name, access ):
         domain_flag_dict = {}
 
-        if type(access) == dict:
+        if isinstance( access, dict ):
             # _info( f"device_flags_map: {access}" )
-            try:
-                flags = access["flags"]
-                for flag,value in flags.items():
-                    if value:
-                        domain_flag_dict[flag] = True
-            except:
-                return domain_flag_dict
+            flags = access.get( "flags" )
+            # anything other than a flags dictionary maps to no flags
+            if isinstance( flags, dict ):
+                domain_flag_dict = { flag: True for flag,value in flags.items() if value }
         else:
             # try 1: is it a property ?
             flags = access.propval( "flags" )
 
-            # try 2: is it a subnode ?
+            # try 2: is it a subnode ? children are indexed by path, so
+            # look it up directly rather than walking them all.
             if not flags[0]:
-                for n in access.children():
-                    if n.name == "flags":
-                        for p in n:
-                            flags.append( p )
+                flags_node = access.child_nodes.get( access.abs_path + "/flags" )
+                if flags_node is not None:
+                    flags = flags + list( flags_node.__props__.values() )
 
             # map the flags to something domains.yaml can output
             # create a flags dictionary, so we can next it into the access
             # structure below, which will then be transformed into yaml later.
-            for flag in flags:
-                try:
-                    if flag.value != '':
-                        # if a flag is present, it means it was set to "true", it
-                        # won't even be here in the false case.
-                        domain_flag_dict[flag.name] = True
-                except:
-                    pass
+            #
+            # if a flag is present, it means it was set to "true", it
+            # won't even be here in the false case.
+            domain_flag_dict = { flag.name: True for flag in flags
+                                                 if getattr( flag, "value", '' ) != '' }
 
         # _info( "isospec_device_flags: %s %s" % (device_name,domain_flag_dict) )
 
@@ -161,14 +241,15 @@ class domain_yaml(object):
 
     def cpu_add( self, domain_or_subsystem, cpu ):
         # this should wrap the addition of an access entry
-        _info( f"cpu_add: {domain_or_subsystem}: {cpu}" )
+        if _logger.isEnabledFor( logging.INFO ):
+            _info( f"cpu_add: {domain_or_subsystem}: {cpu}" )
 
         # is there an cpu list already in the yaml node ?
         # better than this: add a routine to the yaml node to
         # abstract an cpu addition (via device)
         try:
             cpu_list = domain_or_subsystem["cpus"]
-        except:
+        except KeyError:
             cpu_list = LopperProp( "cpus", -1, domain_or_subsystem, [] )
             cpu_list.phandle_resolution = False
             ## TODO: we shouldn't need to do this, as the node is passed
@@ -187,7 +268,7 @@ class domain_yaml(object):
         if device_tree_compat:
             # is there a number in the isospec name ? If so, that is our
             # mask, if not, we set the cpu mask to 0x3 (them all)
-            m = re.match( r'.*?(\d+)', cpu_name )
+            m = _RE_CPU_NUM.match( cpu_name )
             if m:
                 cpu_number = m.group(1)
             else:
@@ -213,9 +294,11 @@ class domain_yaml(object):
                 # 0xf
                 cluster_mask = 0
                 if cpu_number != -1:
+                    cpu_node_name = f"cpu@{cpu_number}"
+                    cpu_bit = 1 << int(cpu_number)
                     for c in compatible_nodes:
-                        if re.search( "cpu@" + cpu_number, c.name ):
-                            cluster_mask = set_bit( cluster_mask, int(cpu_number) )
+                        if c.name.startswith( cpu_node_name ):
+                            cluster_mask |= cpu_bit
                             cluster_cpu_label = c.label
                 else:
                     cluster_cpu_label = ''
@@ -224,74 +307,44 @@ class domain_yaml(object):
                 # cpu mode checks.
                 #    secure
                 #    el
-                try:
-                    cpu_flags = cpus_info["flags"]
-                except:
-                    cpu_flags = {}
-
+                #
+                # The spec's cpu flags are not consulted, so a cpu is
+                # never secure and the el level comes from the cpu_map
                 secure = False
-                mode_mask = 0
-                try:
-                    secure_val = cpu_flags["secure"]
-                    secure = secure_val
-                except Exception as e:
-                    pass
-
-                try:
-                    mode = cpu_flags["mode"]
-                    if mode == "el":
-                        mode_mask = set_bit( mode_mask, 0 )
-                        mode_mask = set_bit( mode_mask, 1 )
-                except:
-                    # no passed mode, use the el level from the cpu_map
-                    if cpu_map:
-                        mode_mask = cpu_map["el"]
-
+                mode_mask = cpu_map["el"] if cpu_map else 0
+
+                cpu_entry = { "dev": cluster_name,    # remove before writing to yaml (if no roundtrip)
+                              "spec_name": cpu_name,  # remove before writing to yaml (if no roundtrip)
+                              "cluster" : cluster_name,
+                              "cluster_cpu" : cluster_cpu_label,
+                              "cpumask" : hex(cluster_mask),
+                              "mode" : { "secure": secure }
+                             }
                 if mode_mask:
-                    cpu_entry = { "dev": cluster_name,    # remove before writing to yaml (if no roundtrip)
-                                  "spec_name": cpu_name,  # remove before writing to yaml (if no roundtrip)
-                                  "cluster" : cluster_name,
-                                  "cluster_cpu" : cluster_cpu_label,
-                                  "cpumask" : hex(cluster_mask),
-                                  "mode" : { "secure": secure,
-                                             "el": hex(mode_mask)
-                                            }
-                                 }
-                else:
-                    cpu_entry = { "dev": cluster_name,    # remove before writing to yaml (if no roundtrip)
-                                  "spec_name": cpu_name,  # remove before writing to yaml (if no roundtrip)
-                                  "cluster" : cluster_name,
-                                  "cluster_cpu" : cluster_cpu_label,
-                                  "cpumask" : hex(cluster_mask),
-                                  "mode" : { "secure": secure }
-                                 }
+                    cpu_entry["mode"]["el"] = hex(mode_mask)
 
                 cpu_list.value.append( cpu_entry )
         else:
             _warning( f"cpus entry {cpus_info[c]} has no device tree mapping" )
 
     def memory_add( self, domain_or_subsystem, memory ):
-        _info( f"memory_add: {domain_or_subsystem}: {memory}" )
+        if _logger.isEnabledFor( logging.INFO ):
+            _info( f"memory_add: {domain_or_subsystem}: {memory}" )
 
         debug = False
-        try:
-            # is it explicitly tagged as memory ?
-            mem_dest_flag = memory["mem"]
+        # is it explicitly tagged as memory ?
+        if "mem" in memory:
             memory_dest = "memory@.*"
+            memory_type = "memory"
 
             # does it have a nodeid ? if it does, it is not just DRAM
             # tag it via the regex.
-            try:
-                nodeid = memory["nodeid"]
-                memory_dest = isospec.memory_dest( memory["name"] )
-                memory_type = isospec.memory_type( memory["name"] )
-            except:
-                memory_type = "memory"
-        except:
+            if "nodeid" in memory:
+                memory_type, memory_dest = isospec.memory_classify( memory["name"] )
+        else:
             # if it isn't, we have a regex match to figure
             # out what type of memory it may be
-            memory_dest = isospec.memory_dest( memory["name"] )
-            memory_type = isospec.memory_type( memory["name"] )
+            memory_type, memory_dest = isospec.memory_classify( memory["name"] )
 
         # if memory_type == "sram":
         #     _info( "debug: sram found" )
@@ -300,7 +353,7 @@ class domain_yaml(object):
         # is there an memory list already in the yaml node ?
         try:
             memory_list = domain_or_subsystem[memory_type]
-        except:
+        except KeyError:
             memory_list = LopperProp( memory_type, -1, domain_or_subsystem, [] )
             memory_list.phandle_resolution = False
             ## TODO: we shouldn't need to do this, as the node is passed
@@ -310,7 +363,7 @@ class domain_yaml(object):
         try:
             memory_dest_address = int(memory["addr"],16)
             memory_dest_size = memory["size"]
-        except:
+        except (KeyError, TypeError, ValueError):
             memory_dest_address = None
             memory_dest_size = None
 
@@ -330,7 +383,7 @@ class domain_yaml(object):
                 #    matches, versus just being in the start + size of
                 #    memory ? Only for SRAM or for all types of memory ?
                 #
-                possible_mem_nodes = self.sdt.tree.nodes(memory_dest)
+                possible_mem_nodes = self.sdt_nodes( memory_dest )
                 if debug:
                     _info( f"possible mem nodes: {possible_mem_nodes}" )
             except Exception as e:
@@ -339,8 +392,7 @@ class domain_yaml(object):
         # if there's no possible device nodes, then we double
         # check the type mapping
         if not possible_mem_nodes:
-            memory_dest = isospec.memory_dest( memory["name"] )
-            memory_type = isospec.memory_type( memory["name"] )
+            memory_type, memory_dest = isospec.memory_classify( memory["name"] )
 
 
         ## Note: when we start to consider the found memory nodes
@@ -364,14 +416,15 @@ class domain_yaml(object):
 
     def device_add( self, domain_or_subsystem, device, flags ):
         # this should wrap the addition of an access entry
-        _info( f"device_add: {domain_or_subsystem}: {device}" )
+        if _logger.isEnabledFor( logging.INFO ):
+            _info( f"device_add: {domain_or_subsystem}: {device}" )
 
         # is there an access list already in the yaml node ?
         # better than this: add a routine to the yaml node to
         # abstract an access addition (via device)
         try:
             access_list = domain_or_subsystem["access"]
-        except:
+        except KeyError:
             access_list = LopperProp( "access", -1, domain_or_subsystem, [] )
             access_list.phandle_resolution = False
             ## TODO: we shouldn't need to do this, as the node is passed
@@ -380,7 +433,7 @@ class domain_yaml(object):
 
         try:
             address = device['addr']
-            tnodes = self.sdt.tree.addr_node( address )
+            tnodes = self.addr_nodes( address )
             if not tnodes:
                 raise Exception( f"No node found for: {device}" )
 
@@ -417,10 +470,11 @@ class isospec(object):
     #
     # This is a static variable!
     #
+    # keys are matched as substrings of the spec name
     iso_memory_device_map = {
             "DDR0" : ["memory", "memory@.*"],
-            "OCM.*" : ["sram", None],
-            ".*TCM.*" : ["sram", None]
+            "OCM" : ["sram", None],
+            "TCM" : ["sram", None]
     }
 
     def __init__( self, json_file = None ):
@@ -437,6 +491,13 @@ class isospec(object):
 
         self.permissive = False
 
+        # built on first use by base_access()
+        self.__base_access_list = None
+
+        # decoded access lists, indexed by spec node path. Filled
+        # by access_chunks()
+        self.__access_cache = {}
+
         # trackers are indexed by subsystem or domain name, then by
         # device name
         self.trackers = {}
@@ -446,28 +507,30 @@ class isospec(object):
 
 
     @classmethod
-    def memory_type( cls, name ):
+    @functools.lru_cache( maxsize=512 )
+    def memory_classify( cls, name ):
+        """ returns the (type, dest) of a memory entry, based on its name
+
+            Device names repeat heavily across subsystems and domains,
+            so the result is cached.
+        """
         mem_found = None
         for n,v in isospec.iso_memory_device_map.items():
-            if re.search( n, name ):
+            if n in name:
                 mem_found = v
 
         if mem_found:
-            return mem_found[0]
+            return mem_found[0], mem_found[1]
 
-        return "memory"
+        return "memory", ""
 
     @classmethod
-    def memory_dest( cls, name ):
-        mem_found = None
-        for n,v in isospec.iso_memory_device_map.items():
-            if re.search( n, name ):
-                mem_found = v
-
-        if mem_found:
-            return mem_found[1]
+    def memory_type( cls, name ):
+        return cls.memory_classify( name )[0]
 
-        return ""
+    @classmethod
+    def memory_dest( cls, name ):
+        return cls.memory_classify( name )[1]
 
     def json_read( self, json_file ):
         # convert the spec to a LopperTree for consistent manipulation
@@ -479,8 +542,9 @@ class isospec(object):
 
             # process the info section of the .iss file
             try:
-                if self.json_tree["/info"]:
-                    format = self.json_tree["/info"]["format"].value
+                info = self.json_tree["/info"]
+                if info:
+                    format = info["format"].value
                     if format == "shallow":
                         _error( "shallow format iss files are not currently supported", True )
             except Exception as e:
@@ -489,7 +553,8 @@ class isospec(object):
             # this is the default settings for devices, it also creates
             # a refcount dictionary
             self.default_settings = self.isospec_subsystem( "/default_settings/subsystems/default" )
-            # the below are the global list of devices
+            # the below are the global list of devices, indexed by
+            # name. References are counted in the trackers, not here.
             self.device_dict, self.smid_dict, self.other_dict = self.device_collect()
 
             subsystem_list = self.json_tree["/design/subsystems"].children()
@@ -507,37 +572,41 @@ class isospec(object):
                 _info( f"exception processing base protection: {e}" )
                 pass
 
-            s = self.json_tree["/design/subsystems"]
-
             ## Build a dictionary of subsystems
             for subsystem in subsystem_list:
-                self.subsystems[subsystem.name] = {}
+                subsystem_name = subsystem.name
+                subsystem_dict = {}
+                self.subsystems[subsystem_name] = subsystem_dict
                 # _info( f"subsystem: {subsystem}" )
                 try:
                     # does it have access ?
-                    subsystem_access = subsystem["access"]
+                    subsystem_access = self.access_chunks( subsystem )
                     for a in subsystem_access:
                         access_dest = self.access_target( a )
                         try:
                             # TODO: these trackers aren't really needed, consider
                             #       dropping them. We have the dedicated "trackers"
-                            self.subsystems[subsystem.name][access_dest["name"]] = {
-                                                                                     "refcount": 0,
-                                                                                     "access": access_dest
-                                                                                    }
+                            subsystem_dict[access_dest["name"]] = {
+                                                                    "refcount": 0,
+                                                                    "access": access_dest
+                                                                   }
                         except Exception as e:
                             _info( f"Exception creating tracker: {e}" )
                             continue
 
                     try:
-                        domain_parent = self.json_tree[subsystem.abs_path + "/domains"]
+                        # children are indexed by path, looking the domains
+                        # up there avoids a search of the whole spec tree
+                        # when a subsystem has no domains.
+                        domain_parent = subsystem.child_nodes[subsystem.abs_path + "/domains"]
                         for d in domain_parent.children():
-                            self.domains[d.name] = {}
+                            domain_dict = {}
+                            self.domains[d.name] = domain_dict
                             # this allows quick access to the domains dictionaries, which are kept
                             # in a flat dictionary, also for easy access
-                            self.subsystems[subsystem.name]["domain:" + d.name] = self.domains[d.name]
+                            subsystem_dict["domain:" + d.name] = domain_dict
 
-                            domain_access = d["access"]
+                            domain_access = self.access_chunks( d )
                             for a in domain_access:
                                 access_dest = self.access_target( a )
                                 try:
@@ -546,17 +615,17 @@ class isospec(object):
                                     # dictionary index
                                     ## TODO: similarly,we don't likely need the tracker, but
                                     ##       we do look these up later by the dictionary and name
-                                    self.domains[d.name][access_dest["name"]] = {
-                                                                                   "refcount" : 0,
-                                                                                   "subsystem": subsystem.name,
-                                                                                   "access": access_dest
-                                                                                }
+                                    domain_dict[access_dest["name"]] = {
+                                                                         "refcount" : 0,
+                                                                         "subsystem": subsystem_name,
+                                                                         "access": access_dest
+                                                                      }
                                 except Exception as e:
                                     _info( f"exception while setting up domain tracking: {e}" )
 
-                    except:
+                    except Exception:
                         pass
-                except:
+                except Exception:
                     pass
 
     def isospec_subsystem( self, name ):
@@ -566,40 +635,39 @@ class isospec(object):
 
         try:
             subsystem_node = json_tree[name]
-        except:
+        except KeyError:
             _warning( f"no defaults found under: {name}" )
 
         try:
-            default_access = subsystem_node["access"]
-            #access_list = []
-            for d in range(len(default_access)):
-                element =  default_access[d]
-                # access_list.append( default_access[d] )
+            default_access = prop_list( subsystem_node["access"] )
+            verbose = _logger.isEnabledFor( logging.INFO )
+            for element in default_access:
                 try:
                     dname = element["name"]
                     try:
                         dtype = element["type"]
-                    except:
+                    except KeyError:
                         dtype = "device"
 
                     try:
                         destinations = element["destinations"]
-                    except:
+                    except KeyError:
                         try:
                             destinations = element["SMIDs"]
-                        except:
+                        except KeyError:
                             destinations = []
 
                     try:
                         flags = element["flags"]
-                    except:
+                    except KeyError:
                         flags = {}
 
-                    _info( f"[{name}/access] device found:" )
-                    _info( f"    name: {dname}" )
-                    _info( f"    type: {dtype}" )
-                    _info( f"    destinations: {destinations}" )
-                    _info( f"    flags: {flags}" )
+                    if verbose:
+                        _info( f"[{name}/access] device found:" )
+                        _info( f"    name: {dname}" )
+                        _info( f"    type: {dtype}" )
+                        _info( f"    destinations: {destinations}" )
+                        _info( f"    flags: {flags}" )
 
                     subsystem_dict[dname] = {
                         "refcount" : 0,
@@ -611,7 +679,7 @@ class isospec(object):
                         }
                 except Exception as e:
                     _info( f"exception: {e}" )
-        except:
+        except Exception:
             _warning( f"subsystem: {name} has no access" )
 
         return subsystem_dict
@@ -628,37 +696,30 @@ class isospec(object):
             design = isospec_json_tree["/design"]
             # otherwise it is in the cells
             design_cells = isospec_json_tree["/design/cells"]
-        except:
+        except KeyError:
             _warning( "no design/cells found in isolation spec" )
-            return device_dict
+            return device_dict, smid_dict, other_dict
 
-        cell_list = [ design ]
-        cell_list.extend( design_cells.subnodes() )
-        for cell in cell_list:
+        debug = _logger.isEnabledFor( logging.DEBUG )
+        for cell in chain( [ design ], design_cells.subnodes() ):
             try:
                 dests = cell["destinations"]
-                _debug( f"processing cell: {cell.name}" )
-                _debug( f"           destinations {dests.abs_path} [{len(dests)}]" )
-                for d in range(len(dests)):
-                    dest = dests[d]
-                    _debug( f"                dest: {dest}" )
+                dest_list = prop_list( dests )
+                if debug:
+                    _debug( f"processing cell: {cell.name}" )
+                    _debug( f"           destinations {dests.abs_path} [{len(dest_list)}]" )
+                for dest in dest_list:
+                    if debug:
+                        _debug( f"                dest: {dest}" )
                     # A device has to have a nodeid for us to consider it, since
                     # otherwise it can't be referenced. The exception to this is
                     # memory, since memory entries never have nodeids.
-                    try:
-                        nodeid = dest["nodeid"]
-                        device_dict[dest["name"]] = {
-                                                      "refcount": 0,
-                                                      "dest": dest
-                                                    }
-                    except:
-                        try:
-                            is_it_mem = dest["mem"]
-                            # _info( f"we found memory: {dest}" )
-                        except:
-                            ## We could do the second regex match on other devices
-                            ## to see if they are memory. i.e. DDRxy ..
-                            is_it_mem = False
+                    if "nodeid" in dest:
+                        device_dict[dest["name"]] = dest
+                    else:
+                        ## We could do the second regex match on other devices
+                        ## to see if they are memory. i.e. DDRxy ..
+                        is_it_mem = dest.get( "mem", False )
 
                         # this may be controlled by a command line option
                         # in the future
@@ -669,106 +730,94 @@ class isospec(object):
                         ##    for nodeid on non-memory flagged entries below.
                         if is_it_mem:
                             if not skip_memory:
-                                device_dict[dest["name"]] = {
-                                    "refcount": 0,
-                                    "dest": dest
-                                }
+                                device_dict[dest["name"]] = dest
                             else:
                                 _debug( "                memory detected, but skip is set" )
                         else:
                             # no nodeid, skip
-                            other_dict[dest["name"]] = {
-                                    "refcount": 0,
-                                    "dest": dest
-                                }
-                            _debug( f"                   ** destination '{dest}' device has no nodeid, adding to 'other'" )
+                            other_dict[dest["name"]] = dest
+                            if debug:
+                                _debug( f"                   ** destination '{dest}' device has no nodeid, adding to 'other'" )
 
                 dests = cell["SMIDs"]
-                _debug( f"           SMIDs {dests.abs_path} [{len(dests)}]" )
-                for d in range(len(dests)):
-                    dest = dests[d]
-                    _debug( f"                dest: {dest}" )
+                dest_list = prop_list( dests )
+                if debug:
+                    _debug( f"           SMIDs {dests.abs_path} [{len(dest_list)}]" )
+                for dest in dest_list:
+                    if debug:
+                        _debug( f"                dest: {dest}" )
                     try:
-                        name = dest["name"]
-                        smid_dict[name] = {
-                            "refcount": 0,
-                            # Could be renmaed to "dests" to match the subsystem tracker type
-                            "dest": dest
-                            }
-                    except:
-                        _debug( f"                    skipping dest {dest} ({e})" )
+                        smid_dict[dest["name"]] = dest
+                    except KeyError as e:
+                        if debug:
+                            _debug( f"                    skipping dest {dest} ({e})" )
 
-            except:
+            except Exception:
                     continue
 
         return device_dict, smid_dict, other_dict
 
+    def access_chunks( self, spec_node ):
+        """ returns the decoded access list of a subsystem or domain
+
+            Both setup() and isodomain_convert() walk the access of
+            every subsystem and domain, so each list is decoded once
+            and shared. Callers must not modify the returned list.
+
+            KeyError is raised if the node has no access.
+        """
+        path = spec_node.abs_path
+        try:
+            return self.__access_cache[path]
+        except KeyError:
+            pass
+
+        access_chunks = prop_list( spec_node["access"] )
+        self.__access_cache[path] = access_chunks
+
+        return access_chunks
+
     def access_type( self, access_entry ):
         # the default is "device" if the access entry isn't
         # carrying any type information
-        try:
-            access_type = access_entry["type"]
-        except:
-            access_type = "device"
-
-        return access_type
+        return access_entry.get( "type", "device" )
 
     def access_target( self, access_entry ):
-        access = {}
-
         # does it have "same_as_default" ? in that case
         # we look up further, otherwise return what was
         # passed in. This allows the caller to abstract
         # where there access definition comes from
-        try:
-            name = access_entry["same_as_default"]
-            access = self.default_settings[name]["json"]
-        except Exception as e:
-            # try base protections
-            try:
-                access = self.__base_protection[name]["json"]
-            except:
-                # there's no entry, and no base protection, just
-                # return what was passed in. This allows the
-                # caller to normalize their access processing
-                # by always getting something back
-                access = access_entry
+        name = access_entry.get( "same_as_default" )
+        if name is None:
+            return access_entry
 
-        return access
+        if name in self.default_settings:
+            return self.default_settings[name]["json"]
 
-    def access_flags( self, access, translate=False ):
-        flags = {}
-        try:
-            flags = access["flags"]
-            # placeholder for flag translation / mapping, for
-            # now we just return the raw flags
-        except:
-            pass
+        # try base protections
+        if name in self.__base_protection:
+            return self.__base_protection[name]["json"]
 
-        return flags
+        # there's no entry, and no base protection, just
+        # return what was passed in. This allows the
+        # caller to normalize their access processing
+        # by always getting something back
+        return access_entry
+
+    def access_flags( self, access, translate=False ):
+        # placeholder for flag translation / mapping, for
+        # now we just return the raw flags
+        return access.get( "flags", {} )
 
     ## just returns the names, not the device
     def dests( self, access ):
         destlist = []
-        try:
-            try:
-                destinations = access["destinations"]
-                destlist.extend( destinations )
-                # for now, we only allow one type of destination
-                return destlist
-            except:
-                pass
-
-            try:
-                #_info( f"checking smids: {access}" )
-                destinations = access["SMIDs"]
-                destlist.extend( destinations )
-                # for now, we only allow one type of destination
-                return destlist
-            except:
-                pass
-        except:
-            pass
+        # for now, we only allow one type of destination
+        if "destinations" in access:
+            destlist.extend( access["destinations"] )
+        elif "SMIDs" in access:
+            #_info( f"checking smids: {access}" )
+            destlist.extend( access["SMIDs"] )
 
         return destlist
 
@@ -781,7 +830,7 @@ class isospec(object):
                 destinations = access["destinations"]
                 dests = self.devices( destinations )
                 destlist.extend( dests )
-            except:
+            except (KeyError, TypeError):
                 pass
 
             try:
@@ -790,32 +839,21 @@ class isospec(object):
                 for d in destinations:
                     dests = self.devices( d )
                     destlist.extend( dests )
-            except:
+            except (KeyError, TypeError):
                 pass
-        except:
+        except Exception:
             pass
 
         return destlist
 
     ## find a device by name
     def devices( self, device_name_list, return_other = False ):
-        devlist = []
-        try:
-            if self.device_dict:
-                for d in device_name_list:
-                    device = self.device_dict[d]
-                    devlist.append( device['dest'] )
-        except:
-            pass
+        device_dict = self.device_dict
+        devlist = [ device_dict[d] for d in device_name_list if d in device_dict ]
 
         if return_other and self.permissive:
-            try:
-                if self.other_dict:
-                    for d in device_name_list:
-                        device = self.other_dict[d]
-                        devlist.append( device['dest'] )
-            except:
-                pass
+            other_dict = self.other_dict
+            devlist.extend( [ other_dict[d] for d in device_name_list if d in other_dict ] )
 
         return devlist
 
@@ -824,16 +862,8 @@ class isospec(object):
     ##       fails in device lookup. That way we don't push
     ##       the type detection onto the caller
     def cpus( self, cpu_name_list ):
-        cpulist = []
-        try:
-            if self.smid_dict:
-                for c in cpu_name_list:
-                    cpu = self.smid_dict[c]
-                    cpulist.append( cpu['dest'] )
-        except:
-            pass
-
-        return cpulist
+        smid_dict = self.smid_dict
+        return [ smid_dict[c] for c in cpu_name_list if c in smid_dict ]
 
     def is_subsystem( self, name ):
         sub = self.subsystem( name )
@@ -846,10 +876,72 @@ class isospec(object):
         try:
             base_protection = self.json_tree["/design/base_protection"]
             return base_protection
-        except:
+        except KeyError:
             return None
 
 
+    def base_access( self ):
+        """ returns the base protection access entries that apply to
+            all domains (SMID of ANY)
+
+            The list only depends on the spec, so it is built on first
+            use and returned from the cache after that.
+        """
+        if self.__base_access_list is not None:
+            return self.__base_access_list
+
+        base_protection = self.base_protection()
+        base_access_list = []
+        if base_protection:
+            _info( "base_access: checking base protection" )
+            verbose = _logger.isEnabledFor( logging.INFO )
+            try:
+                for access in self.access_chunks( base_protection ):
+                    access = self.access_target( access )
+                    if verbose:
+                        _info( f"    base proection access: ({type(access)} {access}" )
+                    try:
+                        smids = access["SMIDs"]
+                        smid_all = False
+                        if 'ANY' in smids:
+                            smid_all = True
+                        else:
+                            # Only items tagged with ANY for the SMID
+                            # get processed to be added to domains.
+                            continue
+                    except Exception as e:
+                        continue
+
+                    # This covers devices and memory, since they are split
+                    # apart in the main processing loop.
+                    access_type = self.access_type( access )
+                    if access_type == "device":
+                        _info( f"      base protection device: {access['name']}" )
+                        try:
+                            dests = self.dests( access )
+                            if verbose:
+                                _info( f"       device dests: {dests}" )
+                                devices = self.devices( dests, True )
+                                _info( f"       devices: {devices}" )
+
+                            ## if there are devices, they should be added to all
+                            ## domains.
+
+                            base_access_list.append( access )
+
+                        except Exception:
+                            pass
+                    else:
+                        _info( f"non-device SMID any detected ... {access}" )
+
+            except Exception as e:
+                _info( f"Exception during base protection checking: {e}" )
+
+        self.__base_access_list = base_access_list
+
+        return base_access_list
+
+
     def subsystem( self, name = None ):
         """ returns all design subsystems, or a specific design
             subsystem if a name is passed
@@ -875,7 +967,7 @@ class isospec(object):
                 # except:
                 #     pass
                 return design_subs
-        except:
+        except KeyError:
             return []
 
 
@@ -885,12 +977,9 @@ class isospec(object):
         subsystem = None
         spec_parent_node = spec_node.parent
         while spec_parent_node:
-            try:
-                id = spec_parent_node["id"].value
+            # no id, it isn't a subsystem
+            if spec_parent_node.propval( "id" ) != [""]:
                 subsystem = spec_parent_node
-            except Exception as e:
-                # no id, it isn't a subsystem
-                pass
 
             spec_parent_node = spec_parent_node.parent
 
@@ -913,7 +1002,7 @@ class isospec(object):
                             return [dd]
 
                 return []
-        except:
+        except Exception:
             return []
 
         return []
@@ -931,10 +1020,9 @@ class isospec(object):
         ## when called with value as the default, we are initializing
         ## the tracking entry for a given name. Call with "true" to
         ## reference a device
-        try:
-            tracker = self.trackers[tracker_name][ttype]
-        except Exception as e:
-            _debug( f"No tracker is initialized for {tracker_name}, cannot track device {dev}: {e}" )
+        tracker = self._tracker( tracker_name, ttype )
+        if tracker is None:
+            _debug( f"No tracker is initialized for {tracker_name}, cannot track device {dev}" )
             debug_exit()
             return
 
@@ -944,48 +1032,40 @@ class isospec(object):
     def tracker_dref( self, tracker_name, dev, ttype = "dev" ):
         ## returns True if something is refereced, false otherwise
         ## "dev" is an access dictonary
-        try:
-            tracker = self.trackers[tracker_name][ttype]
-        except Exception as e:
+        tracker = self._tracker( tracker_name, ttype )
+        if tracker is None:
             return False
 
-        try:
-            # if there's an entry at all, it is being
-            # tracked, if it has a reference it gets updated
-            # to True
-            return tracker[dev["name"]]
-        except:
-            return False
+        # if there's an entry at all, it is being
+        # tracked, if it has a reference it gets updated
+        # to True
+        return tracker.get( dev["name"], False )
 
     def tracker_check( self, tracker_name, dev, ttype = "dev" ):
         ## returns True if something is being tracked, false otherwise
         ## "dev" is an access dictonary
-        try:
-            tracker = self.trackers[tracker_name][ttype]
-        except Exception as e:
+        tracker = self._tracker( tracker_name, ttype )
+        if tracker is None:
             return False
 
-        try:
-            # if there's an entry at all, it is being
-            # tracked.
-            entry = tracker[dev["name"]]
-            return True
-        except:
-            return False
+        # if there's an entry at all, it is being
+        # tracked.
+        return dev["name"] in tracker
+
+    def _tracker( self, tracker_name, ttype ):
+        ## returns the ttype tracker for a name, None if there isn't one
+        trackers = self.trackers.get( tracker_name )
+        if trackers is None:
+            return None
+
+        return trackers.get( ttype )
 
     def tracker_get( self, tracker_name, ttype="dev" ):
+        trackers = self.trackers.get( tracker_name, {} )
         if ttype:
-            try:
-                tracker = self.trackers[tracker_name][ttype]
-                return tracker
-            except:
-                return {}
-        else:
-            try:
-                trackers = self.trackers[tracker_name]
-                return trackers
-            except:
-                return {}
+            return trackers.get( ttype, {} )
+
+        return trackers
 
     def isodomain_convert( self, spec_node, domains_tree ):
         """ converts an isolation spec domain to a yaml domain
@@ -994,62 +1074,23 @@ class isospec(object):
         ## TODO: we should add the subsystem name, since there's
         ##       no guarantee at all that the domain names are unique
 
-        yaml_node = domains_tree.tree.nodes( spec_node.name )[0]
+        # node attribute access goes through LopperNode.__getattribute__,
+        # so the names used for every access entry are read once
+        domain_name = spec_node.name
+        yaml_node = domains_tree.node( domain_name )
 
         containing_subsystem = self.subsystem_container( spec_node )
+        if containing_subsystem:
+            containing_subsystem_name = containing_subsystem.name
 
-        base_protection = self.base_protection()
-        base_access_list = []
-        if base_protection:
-            _info( "iso_domain_convert: checking base protection" )
-            access_list = base_protection["access"]
-            try:
-                access_chunks = json.loads( access_list.value )
-                for access in access_chunks:
-                    access = self.access_target( access )
-                    _info( f"    base proection access: ({type(access)} {access}" )
-                    try:
-                        smids = access["SMIDs"]
-                        smid_all = False
-                        if 'ANY' in smids:
-                            smid_all = True
-                        else:
-                            # Only items tagged with ANY for the SMID
-                            # get processed to be added to domains.
-                            continue
-                    except Exception as e:
-                        continue
-
-                    # This covers devices and memory, since they are split
-                    # apart in the main processing loop.
-                    access_type = self.access_type( access )
-                    if access_type == "device":
-                        _info( f"      base protection device: {access['name']}" )
-                        try:
-                            dests = self.dests( access )
-                            _info( f"       device dests: {dests}" )
-                            devices = self.devices( dests, True )
-                            _info( f"       devices: {devices}" )
-
-                            ## if there are devices, they should be added to all
-                            ## domains.
-
-                            base_access_list.append( access )
-
-                        except:
-                            pass
-                    else:
-                        _info( f"non-device SMID any detected ... {access}" )
-
-            except Exception as e:
-                _info( f"Exception during base protection checking: {e}" )
+        base_access_list = self.base_access()
 
         # The node indexed dictionary will be device names and a
         # True/False if it is referenced.
-        self.tracker_init( spec_node.name )
+        self.tracker_init( domain_name )
 
         try:
-            _info( f"isodomain_convert: {spec_node.name}" )
+            _info( f"isodomain_convert: {domain_name}" )
 
             domain = spec_node
 
@@ -1060,8 +1101,9 @@ class isospec(object):
                 pass
 
             try:
-                access_list = spec_node["access"]
-                access_chunks = json.loads( access_list.value )
+                # the decoded access list is shared, so it is copied
+                # before the base access is added
+                access_chunks = list( self.access_chunks( spec_node ) )
 
                 if base_access_list:
                     # NOTE: it is an open question if we should apply the base protection to
@@ -1071,9 +1113,11 @@ class isospec(object):
                     _info( "isodomain_convert: adding base access list to domain access list" )
                     access_chunks.extend( base_access_list )
 
+                verbose = _logger.isEnabledFor( logging.INFO )
                 # for access in access_list:
                 for access in access_chunks:
-                    _info( f"isodomain_convert: processing access entry: ({type(access)} {access}" )
+                    if verbose:
+                        _info( f"isodomain_convert: processing access entry: ({type(access)} {access}" )
 
                     access = self.access_target( access )
                     access_type = self.access_type( access )
@@ -1097,23 +1141,15 @@ class isospec(object):
                             ## check if if has the "mem": "true" flag,
                             ## or if it matches a regex.
                             for dev in devices:
-                                try:
-                                    mem_flag = dev["mem"]
-                                except:
-                                    mem_flag = False
-
-                                if mem_flag:
+                                if dev.get( "mem", False ):
                                     # _info( f"                   device is memory: {dev}" )
                                     domains_tree.memory_add( yaml_node, dev )
-                                    self.track_ref(spec_node.name, dev, "mem", False)
+                                    self.track_ref(domain_name, dev, "mem", False)
                                 else:
-                                    try:
-                                        # if dev["name"] in self.tracker_get( spec_node.name, "dev" ).keys():
-                                        if self.tracker_check( spec_node.name, dev, "dev" ):
-                                            _info( f"   duplicated device detected: {dev['name']}, skipping it ... " )
-                                            continue
-                                    except Exception as e:
-                                        pass
+                                    # if dev["name"] in self.tracker_get( domain_name, "dev" ).keys():
+                                    if self.tracker_check( domain_name, dev, "dev" ):
+                                        _info( f"   duplicated device detected: {dev['name']}, skipping it ... " )
+                                        continue
 
                                     # add the devices to the node
                                     flags = domains_tree.device_flags_map( dev, access )
@@ -1123,47 +1159,30 @@ class isospec(object):
                                     #
                                     # initialize ourself to False, any subdomains will toggle this
                                     # to true if they do reference it (the second call here)
-                                    self.track_ref(spec_node.name, dev, "dev", False)
+                                    self.track_ref(domain_name, dev, "dev", False)
                                     if containing_subsystem:
                                         try:
                                             # this is the containing subsystem, track the reference
                                             # there
-                                            self.track_ref(containing_subsystem.name,dev, "dev" )
-                                        except:
+                                            self.track_ref(containing_subsystem_name,dev, "dev" )
+                                        except KeyError:
                                             pass
 
-                            try:
-                                mem = yaml_node["memory"]
-                                if len(mem) == 1:
-                                    # force an empty entry if there's only one memory, since this
-                                    # ensures that the yaml will be in list form. If we don't
-                                    # do this, then assists down the pipeline have to deal with
-                                    # either lists or yaml nodes
-                                    mem.value.append( {} )
-                            except Exception as e:
-                                pass
-
-                        except:
+                        except Exception:
                             pass
                     elif access_type == "cpu_list":
                         try:
                             dests = self.dests( access )
-                            _info( f"                     cpus dests: {dests}" )
+                            if verbose:
+                                _info( f"                     cpus dests: {dests}" )
                             cpus = self.cpus( dests )
                             # _info( f"                     cpus: {cpus}" )
-                            _info( f"processing cpu list: {cpus}" )
+                            if verbose:
+                                _info( f"processing cpu list: {cpus}" )
                             for c in cpus:
                                 # add the cpus to the node
                                 domains_tree.cpu_add( yaml_node, c )
-                                self.track_ref(spec_node.name, c, "cpu", False)
-
-                            if len(cpus) == 1:
-                                # force an empty entry if there's only one cpu, since this
-                                # ensures that the yaml will be in list form. If we don't
-                                # do this, then assists down the pipeline have to deal with
-                                # either lists or yaml nodes
-                                cpu_list = yaml_node["cpus"]
-                                cpu_list.value.append( {} )
+                                self.track_ref(domain_name, c, "cpu", False)
 
                         except Exception as e:
                             _info( f"exception procesing cpus: {e}" )
@@ -1177,6 +1196,18 @@ class isospec(object):
                     else:
                         _error( f"unknown spec type: {access_type}" )
 
+                # force an empty entry if there's only one memory or cpu, since
+                # this ensures that the yaml will be in list form. If we don't
+                # do this, then assists down the pipeline have to deal with
+                # either lists or yaml nodes
+                for list_name in ( "memory", "cpus" ):
+                    try:
+                        entries = yaml_node[list_name]
+                        if len(entries) == 1:
+                            entries.value.append( {} )
+                    except KeyError:
+                        pass
+
             except Exception as e:
                 # no access
                 # _info( f"no access found: {e}" )
@@ -1344,20 +1375,13 @@ def isospec_domain( tgt_node, sdt, options ):
     """assist entry point, called from lopper when a node is
        identified, or passed as a command line assist
     """
-    try:
-        verbose = options['verbose']
-    except:
-        verbose = 0
-
-    try:
-        args = options['args']
-    except:
-        args = []
+    verbose = options.get( 'verbose', 0 )
+    args = options.get( 'args', [] )
 
     lopper.log._init( __name__ )
 
     # --permissive means that non-SMID devices/memory will be consulted
-    opts,args2 = getopt.getopt( args, "mpvh", [ "help", "audit", "verbose", "permissive", "nomemory" ] )
+    opts,args2 = getopt.getopt( args, _OPTS_SHORT, _OPTS_LONG )
 
     if opts == [] and args2 == []:
         usage()
@@ -1366,19 +1390,21 @@ def isospec_domain( tgt_node, sdt, options ):
     audit = False
     memory = True
     permissive = False
+    compare_list = []
     for o,a in opts:
         # print( "o: %s a: %s" % (o,a))
-        if o in ('-m', "--nomemory" ):
+        opt = _OPTS_MAP.get( o )
+        if opt == "nomemory":
             memory = False
-        elif o in ('-v', "--verbose"):
+        elif opt == "verbose":
             verbose = verbose + 1
-        elif o in ('-c', "--compare"):
+        elif opt == "compare":
             compare_list.append( a )
-        elif o in ('-p', "--permissive"):
+        elif opt == "permissive":
             permissive = True
-        elif o in ("--audit"):
+        elif opt == "audit":
             audit = True
-        elif o in ('-h', "--help"):
+        elif opt == "help":
             # usage()
             sys.exit(1)
 
@@ -1390,6 +1416,9 @@ def isospec_domain( tgt_node, sdt, options ):
 
     _info( f"cb: isospec_domain( {tgt_node}, {sdt}, {verbose} )" )
 
+    if compare_list:
+        _warning( f"isospec: --compare is not implemented, ignoring: {compare_list}" )
+
     if sdt.support_files:
         isospecf = sdt.support_files.pop()
     else:
@@ -1412,10 +1441,8 @@ def isospec_domain( tgt_node, sdt, options ):
     except FileNotFoundError as e:
         _error( f"ispec file {isospecf} not found", True )
 
-    # convert the spec to a LopperTree for consistent manipulation
-    json_in = LopperJSON( json=iso_file_abs )
-    json_tree = json_in.to_tree()
-
+    # the isospec object converts the spec to a LopperTree for
+    # consistent manipulation
     spec = isospec( iso_file_abs )
     spec.permissive = permissive
 
@@ -1479,29 +1506,31 @@ def isospec_domain( tgt_node, sdt, options ):
     # create our domains.yaml tree
     domains = domain_yaml( sdt )
 
-    # process the subsystems in the spec
+    # process the subsystems in the spec, remembering the domains of
+    # each one for the audit
+    subsystems_list = []
     for sub in spec.subsystem():
         _info( f"processing: subsystem: {type(sub)} {sub}" )
-        try:
-            sub_id = sub["id"].value
-        except:
+        sub_id = sub.propval( "id" )
+        if sub_id == [""]:
             sub_id = 0
         subsystem_yaml_node = domains.subsystem_add( sub.name, sub_id )
         spec.isodomain_convert( sub, domains )
 
         # does the subsystem have domains ? if so, process them
         sub_domains = spec.domain( sub )
+        subsystems_list.append( (sub, sub_domains) )
         if sub_domains:
             domain_container_node = domains.node_add( "domains", subsystem_yaml_node )
             for d in sub_domains:
                 _info( f"    adding domain: {d.name}" )
-                domain_node = domains.domain_add( d.name, domain_container_node, sub["id"] )
+                domain_node = domains.domain_add( d.name, domain_container_node, sub_id )
                 spec.isodomain_convert( d, domains )
 
     # check our refcounter(s)
     if audit:
         lopper.log._level( logging.INFO, __name__ )
-        for sub in spec.subsystem():
+        for sub, sub_domains in subsystems_list:
             try:
                 trackers = spec.tracker_get(sub.name,None)
                 _info( "" )
@@ -1531,7 +1560,7 @@ def isospec_domain( tgt_node, sdt, options ):
                 _info( f"  unreferenced memory : {munrefd}" )
                 _info( "" )
 
-                for d in spec.domain( sub ):
+                for d in sub_domains:
                     header = f"    Audit for domain: {d.name}"
                     header_underline = "    " + "-" * (len(header) - 4)
                     _info( header )
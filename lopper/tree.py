@@ -4745,36 +4745,30 @@ class LopperTree:
 
         return matching_nodes
 
-    def addr_node(self, address):
-        """Find a node in the tree based on an address
+    def addr_index(self):
+        """Build a dictionary of the tree's nodes indexed by address
 
-        This routine searches the tree for a node (device) that is
-        at a given address. Only nodes with @ in their name are
-        considered, since by the device tree spec, these are the
-        required unit address.
+        Only nodes with @ in their name are considered, since by the
+        device tree spec, these are the required unit address. Each
+        of those nodes has its device translation performed (using the
+        address() function), and the translated address (as a hex
+        string) is used as the dictionary key.
 
-        Note: the unit adress is only the starting point. Each
-        identified node has its device translation performed (using
-        the address() function). It is those translated addresses
-        which are used to locate a target node (if one exists).
+        Nodes that translate to the same address are all stored (in
+        tree order) under that key.
+
+        The index is not cached or updated by the tree. Callers that
+        perform many lookups against an unchanging tree can build it
+        once and consult it directly, rather than calling addr_node()
+        repeatedly.
 
         Args:
-          address (int): target translated address to match
+          None
 
         Returns:
-          target node list (LopperNode): the matching node(s), empty otherwise
+          dictionary: hex address (string) -> list of LopperNodes
         """
 
-        lopper.log._debug( f"addr_node {address}" )
-
-        target_node = None
-
-        # TODO: this may be better to calculate once, and then cache
-        #       in a dictionary indexed by address, or add an
-        #       "address" field to each node and consult it. But we
-        #       would have to recalculate it on tree operations that
-        #       modify properties that impact memory mapping.
-
         # gather the nodes with @ in their name
         address_nodes = []
         for n in self.__nodes__.values():
@@ -4801,6 +4795,40 @@ class LopperTree:
                 except Exception as e:
                     address_dict[hex(node_address)] = [ n ]
 
+        return address_dict
+
+    def addr_node(self, address):
+        """Find a node in the tree based on an address
+
+        This routine searches the tree for a node (device) that is
+        at a given address. Only nodes with @ in their name are
+        considered, since by the device tree spec, these are the
+        required unit address.
+
+        Note: the unit adress is only the starting point. Each
+        identified node has its device translation performed (using
+        the address() function). It is those translated addresses
+        which are used to locate a target node (if one exists).
+
+        Args:
+          address (int): target translated address to match
+
+        Returns:
+          target node list (LopperNode): the matching node(s), empty otherwise
+        """
+
+        lopper.log._debug( f"addr_node {address}" )
+
+        target_node = None
+
+        # TODO: this may be better to calculate once, and then cache
+        #       in a dictionary indexed by address, or add an
+        #       "address" field to each node and consult it. But we
+        #       would have to recalculate it on tree operations that
+        #       modify properties that impact memory mapping. Callers
+        #       with a stable tree can use addr_index() for that.
+        address_dict = self.addr_index()
+
         try:
             target_node = address_dict[address]
         except:
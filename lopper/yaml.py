@@ -784,11 +784,19 @@ class LopperJSON():
                     #         print( "[DBG]: target found, pulling properties" )
 
                 if p.pclass == "json":
-                    _debug( f"json: {p.value} (len: {len(p)})" )
+                    # indexing a json property decodes the entire value on
+                    # every access, so decode the chunks once for the loops
+                    # below.
+                    if p.value:
+                        p_chunks = json.loads( p.value )
+                    else:
+                        p_chunks = [ p[x] for x in range(len(p)) ]
+
+                    _debug( f"json: {p.value} (len: {len(p_chunks)})" )
                     extension_found = False
-                    for x in range(0, len(p)):
+                    for x in range(0, len(p_chunks)):
                         try:
-                            m_val = p[x][expand_string]
+                            m_val = p_chunks[x][expand_string]
                             extension_found = True
                             _debug( f"found extension marker: {m_val}" )
                         except:
@@ -799,16 +807,16 @@ class LopperJSON():
                             extension_found = True
                             _debug( f"found extension name ({expand_string})" )
 
-                    for x in range(0, len(p)):
-                        _debug( f"     [{x}] chunk: {p[x]} ({type(p[x])})" )
+                    for x in range(0, len(p_chunks)):
+                        _debug( f"     [{x}] chunk: {p_chunks[x]} ({type(p_chunks[x])})" )
                         try:
                             # an exception is raised if the chunk doesn't have an index
                             # with <<+, so everything below can assume this is true.
                             if p.name == expand_string:
-                                m_val = p[x]
+                                m_val = p_chunks[x]
                                 dict_check = 0
                             else:
-                                m_val = p[x][expand_string]
+                                m_val = p_chunks[x][expand_string]
                                 dict_check = x
                             if verbose:
                                 print( f"[DBG]                      mval {m_val} ({dict_check})")
@@ -932,7 +940,7 @@ class LopperJSON():
                         # catches the check for expand_string ("<<+" or "<<*")
                         except Exception as e:
                             if extension_found:
-                                new_list.append(p[x])
+                                new_list.append(p_chunks[x])
 
                     # This delete blows up the iteration. We need to save the
                     # list of properties to delete and delete them AFTER we
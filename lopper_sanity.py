@@ -1180,6 +1180,65 @@ ocp:
 
     return outdir + "/yaml-tester.yaml"
 
+def setup_isospec( outdir ):
+    with open( outdir + "/isospec-tester.json", "w") as w:
+            w.write("""\
+{
+    "info": { "format": "deep" },
+    "default_settings": {
+        "subsystems": {
+            "default": {
+                "access": [ { "name": "ethernet0", "destinations": [ "ETH0" ] } ]
+            }
+        },
+        "base_protection": {
+            "access": [ { "name": "gic", "SMIDs": [ "ANY" ], "destinations": [ "GIC" ] } ]
+        }
+    },
+    "design": {
+        "cells": {
+            "sanity_cell": {
+                "destinations": [
+                    { "name": "ETH0", "nodeid": "0x1", "addr": "0xff0c0000" },
+                    { "name": "ETH1", "nodeid": "0x2", "addr": "0xff0d0000" },
+                    { "name": "GIC", "nodeid": "0x3", "addr": "0xf9f00000" }
+                ],
+                "SMIDs": [
+                    { "name": "APU_0" },
+                    { "name": "APU_1" }
+                ]
+            }
+        },
+        "base_protection": {
+            "access": [ { "name": "gic", "SMIDs": [ "ANY" ], "destinations": [ "GIC" ] } ]
+        },
+        "subsystems": {
+            "sanity_ss": {
+                "id": 1,
+                "access": [ { "same_as_default": "ethernet0" } ],
+                "domains": {
+                    "unknown_first": {
+                        "access": [ { "name": "eth", "destinations": [ "UNKNOWN", "ETH1" ] } ]
+                    },
+                    "empty_access": {
+                        "access": []
+                    },
+                    "one_cpu": {
+                        "access": [ { "name": "apu0", "type": "cpu_list", "SMIDs": [ "APU_0" ] } ]
+                    },
+                    "two_cpus": {
+                        "access": [ { "name": "apu0", "type": "cpu_list", "SMIDs": [ "APU_0" ] },
+                                    { "name": "apu1", "type": "cpu_list", "SMIDs": [ "APU_1" ] } ]
+                    }
+                }
+            }
+        }
+    }
+}
+""")
+
+    return outdir + "/isospec-tester.json"
+
 
 def setup_fdt( device_tree, outdir ):
     dt, _ = Lopper.dt_compile( device_tree, "", "", True, outdir )
@@ -1936,6 +1995,24 @@ def tree_sanity_test( fdt, verbose=0 ):
     else:
         test_passed( "alias lookup for invalid node" )
 
+    # address index test
+    addr_index = prop_tree.addr_index()
+    serial_nodes = addr_index.get( "0xff000000" )
+    if serial_nodes and serial_nodes[0].abs_path == "/amba/serial@ff000000":
+        test_passed( "address index lookup" )
+    else:
+        test_failed( f"address index lookup ({serial_nodes})" )
+
+    index_matches = True
+    for address, nodes in addr_index.items():
+        if prop_tree.addr_node( address ) != nodes:
+            index_matches = False
+
+    if index_matches and not prop_tree.addr_node( "0xdeadbeef" ):
+        test_passed( "address index matches addr_node()" )
+    else:
+        test_failed( "address index matches addr_node()" )
+
 
 def lops_code_test( device_tree, lop_file, verbose ):
 
@@ -2323,6 +2400,50 @@ def assists_sanity_test( device_tree, lop_file, verbose, options = "", input_fil
 
     device_tree.cleanup()
 
+def isospec_sanity_test( device_tree, iso_file, outdir, verbose ):
+    device_tree.setup( device_tree.dts, [], "", True, libfdt = libfdt )
+    device_tree.assists_setup( [ "lopper/assists/isospec.py" ] )
+    device_tree.assist_autorun_setup( "isospec", [ iso_file, "isospec-domains.yaml" ] )
+
+    print( "[TEST]: running isospec against tree" )
+    device_tree.perform_lops()
+    device_tree.cleanup()
+
+    with open( outdir + "/isospec-domains.yaml" ) as f:
+        domains = YAML( typ='safe' ).load( f )["domains"]["sanity_ss"]["domains"]
+
+    # a single access entry is written as a mapping, not a list
+    access_names = {}
+    for domain_name, domain in domains.items():
+        access = domain.get( "access", [] )
+        if isinstance( access, dict ):
+            access = [ access ]
+        access_names[domain_name] = [ a["spec_name"] for a in access ]
+
+    if "ETH1" in access_names["unknown_first"]:
+        test_passed( "isospec: devices after an unknown destination" )
+    else:
+        test_failed( f"isospec: devices after an unknown destination ({access_names['unknown_first']})" )
+
+    if "GIC" in access_names["empty_access"]:
+        test_passed( "isospec: base protection for a domain with no access" )
+    else:
+        test_failed( f"isospec: base protection for a domain with no access ({access_names['empty_access']})" )
+
+    # a single cpu gets an empty entry to keep the yaml in list form,
+    # but there is none between the entries of a longer list
+    cpus = domains["one_cpu"]["cpus"]
+    if len(cpus) == 2 and cpus[1] == {}:
+        test_passed( "isospec: single cpu list placeholder" )
+    else:
+        test_failed( f"isospec: single cpu list placeholder ({cpus})" )
+
+    cpus = domains["two_cpus"]["cpus"]
+    if [ c.get( "spec_name" ) for c in cpus ] == [ "APU_0", "APU_1" ]:
+        test_passed( "isospec: cpu list without placeholders" )
+    else:
+        test_failed( f"isospec: cpu list without placeholders ({cpus})" )
+
 def format_sanity_test( device_tree, verbose ):
     device_tree.setup( dt, [], "", True, libfdt = libfdt )
 
@@ -2708,6 +2829,22 @@ if __name__ == "__main__":
         input_files.extend( auto_assists )
         assists_sanity_test( device_tree, None, verbose, "domains_glob_test_child-all", input_files )
 
+        # isolation specification to domains.yaml
+        iso_file = setup_isospec( outdir )
+        device_tree = LopperSDT( dt )
+
+        device_tree.dryrun = False
+        device_tree.verbose = verbose
+        device_tree.werror = werror
+        device_tree.output_file = None
+        device_tree.cleanup_flag = True
+        device_tree.save_temps = False
+        device_tree.outdir = outdir
+        device_tree.use_libfdt = libfdt
+        device_tree.config = None
+
+        isospec_sanity_test( device_tree, iso_file, outdir, verbose )
+
     if format:
         dt = setup_format_tree( outdir )
         yt =  setup_yaml( outdir )